@@ -1,29 +1,88 @@
 """French Deck module"""
+import array
 import collections
-from typing import NamedTuple, List, Dict, Iterable, Iterator, cast
+from types import MappingProxyType
+from typing import NamedTuple, List, Dict, Iterator, Mapping, Tuple
 
 Card = NamedTuple('Card', [('rank', str), ('suit', str)])
 
+# module-level so the hot methods read them with (inline-cached) LOAD_GLOBAL
+# rather than an attribute lookup through the instance and class
+_RANKS: Tuple[str, ...] = tuple([str(n) for n in range(2, 11)] + list('JQKA'))
+_SUITS: Tuple[str, ...] = tuple('spades diamonds clubs hearts'.split())
+# the lookup tables below are derived from these at import, so they are all
+# immutable: tuples and read-only mapping proxies
+_SUIT_VALUES: Mapping[str, int] = MappingProxyType(
+    dict(spades=3, hearts=2, diamonds=1, clubs=0))
+_RANK_VALUES: Mapping[str, int] = MappingProxyType(
+    {r: i for i, r in enumerate(_RANKS)})
+
+
+def _sort_value(card: Card) -> int:
+    rank_value = _RANK_VALUES[card.rank]
+    return rank_value * len(_SUIT_VALUES) + _SUIT_VALUES[card.suit]
+
+
+# every Card, indexed by its packed code, so reading a card is a C-level
+# tuple index rather than a fresh namedtuple
+_CARDS: Tuple[Card, ...] = tuple(Card(rank, suit)
+                                 for suit in _SUITS for rank in _RANKS)
+_CODES: Dict[Card, int] = {card: code for code, card in enumerate(_CARDS)}
+# sorting() value of every packed card code, indexed by code
+_SORT_KEYS: List[int] = [_sort_value(card) for card in _CARDS]
+
 
 class FrenchDeck:
-    ranks: List[str] = [str(n) for n in range(2, 11)] + list('JQKA')
-    suits: List[str] = 'spades diamonds clubs hearts'.split()
-    suit_values: Dict[str, int] = dict(spades=3, hearts=2, diamonds=1, clubs=0)
+    """The standard 52-card deck.
+
+    ranks, suits and suit_values are read-only views of the module tables
+    the deck is packed and sorted by. Unlike earlier versions, a deck can no
+    longer be customised by overriding them: subclasses that try raise
+    TypeError, and instances cannot set attributes.
+    """
+    __slots__ = ('_cards',)
+
+    ranks: Tuple[str, ...] = _RANKS
+    suits: Tuple[str, ...] = _SUITS
+    suit_values: Mapping[str, int] = _SUIT_VALUES
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        overridden = [name for name in ('ranks', 'suits', 'suit_values')
+                      if name in vars(cls)]
+        if overridden:
+            raise TypeError('%s cannot override %s: FrenchDeck always uses '
+                            'the standard 52 cards'
+                            % (cls.__name__, ', '.join(overridden)))
 
     def __init__(self) -> None:
-        self._cards = [Card(rank, suit) for suit in self.suits
-                       for rank in self.ranks]
+        # each card is packed into one byte, its index into _CARDS
+        # (suit_index * len(ranks) + rank_index). counting up from 0 gives
+        # the same suits-major order as a nested loop.
+        self._cards = array.array('B', range(len(_CARDS)))
 
     def __len__(self) -> int:
         return len(self._cards)
 
-    # we don't have to implement this if we cast in line 33
-    # def __iter__(self) -> Iterator[Card]:
-    #     for card in self._cards:
-    #         yield card
-    
+    # __getitem__ alone makes the deck iterable, but only through the legacy
+    # sequence protocol: one Python-level __getitem__ call per card until
+    # IndexError. mapping the _CARDS lookup over the packed array keeps the
+    # whole loop in C.
+    def __iter__(self) -> Iterator[Card]:
+        return map(_CARDS.__getitem__, self._cards)
+
+    # without this, `in` would fall back to iterating and comparing Cards
+    def __contains__(self, card: object) -> bool:
+        try:
+            code = _CODES.get(card)  # type: ignore[call-overload]
+        except TypeError:  # unhashable, so it cannot be a Card
+            return False
+        return code is not None and code in self._cards
+
     def __getitem__(self, position) -> Card:
-        return self._cards[position]
+        if isinstance(position, slice):
+            return list(map(_CARDS.__getitem__, self._cards[position]))
+        return _CARDS[self._cards[position]]
 
     # __getitem__ allows indexing and slicing:
     # >>> deck[0]
@@ -44,8 +103,11 @@ class FrenchDeck:
     # Card(rank='4', suit=
 
     def sorting(self, card: Card) -> int:
-        rank_value = FrenchDeck.ranks.index(card.rank)
-        return rank_value * len(self.suit_values) + self.suit_values[card.suit]
+        return _sort_value(card)
 
     def sorted(self) -> List[Card]:
-        return sorted(cast(Iterable[Card], self), key=self.sorting)
+        # sort the packed codes keyed by the code -> sorting() value table,
+        # then look the cards up in _CARDS. key lookup, int compares and
+        # reification are all C-level calls with no Python frame per card.
+        codes = sorted(self._cards, key=_SORT_KEYS.__getitem__)
+        return list(map(_CARDS.__getitem__, codes))
@@ -1,5 +1,6 @@
 """chapter 2, section 1 list comprehensions"""
+from itertools import product
 
 colors = ['black', 'white']
 sizes = ['S', 'M', 'L']
-tshirts = [(c, s) for c in colors for s in sizes]
+tshirts = list(product(colors, sizes))
@@ -20,32 +20,106 @@ Supports scalar multiplication:
 Vector(9, 12)
 >>> abs(v * 3)
 15.0
+
+Batched absolute values over component arrays:
+
+>>> vector_abs(np.array([3.0, 5.0]), np.array([4.0, 12.0]))
+array([ 5., 13.])
 """
 
-# TODO: write pytest tests!
+from math import sqrt
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+import numpy as np
 
-from math import hypot
+try:
+    import numba
+except ImportError:  # numba is an optional speedup for vector_abs
+    numba = None
 
 
-class Vector():
+# arithmetic results are built with tuple.__new__ directly, skipping the
+# Python-level __new__ that NamedTuple generates to handle field defaults
+_new_tuple = tuple.__new__
 
-    def __init__(self, x: int = 0, y: int = 0) -> None:
-        self.x = x
-        self.y = y
+
+class Vector(NamedTuple):
+    # as a tuple, a Vector is immutable and hashable and carries no
+    # __dict__. methods unpack `x, y = self` (UNPACK_SEQUENCE on a tuple)
+    # rather than going through the field descriptors.
+    x: int = 0
+    y: int = 0
+
+    # numpy would otherwise treat a Vector as a sequence and broadcast over
+    # it, so `np.float64(2) * v` returned an ndarray instead of calling
+    # __rmul__
+    __array_ufunc__ = None
 
     def __repr__(self) -> str:
         return 'Vector(%r, %r)' % (self.x, self.y)
 
     def __abs__(self) -> float:
-        return hypot(self.x, self.y)
+        # naive form is fine for the small coordinates this class is meant
+        # for; use math.hypot(v.x, v.y) if components may overflow a float
+        x, y = self
+        return sqrt(x * x + y * y)
 
+    # tuple truthiness would make Vector(0, 0) true
     def __bool__(self) -> bool:
         return bool(self.x or self.y)
 
-    def __add__(self, other: 'Vector') -> 'Vector':
-        x = self.x + other.x
-        y = self.y + other.y
-        return Vector(x, y)
-
-    def __mul__(self, scalar: int) -> 'Vector':
-        return Vector(self.x * scalar, self.y * scalar)
+    def __add__(self, other: 'Vector') -> 'Vector':  # type: ignore[override]
+        if type(other) is not Vector and not isinstance(other, Vector):
+            return NotImplemented
+        x1, y1 = self
+        x2, y2 = other
+        return _new_tuple(Vector, (x1 + x2, y1 + y2))
+
+    # Python tries a subclass's reflected method before the base class's
+    # forward one, so this is the only chance to stop `(1, 2) + v` from
+    # becoming a tuple concatenation; returning NotImplemented would let
+    # tuple.__add__ run
+    def __radd__(self, other: object) -> 'Vector':
+        raise TypeError('unsupported operand type(s) for +: %r and %r'
+                        % (type(other).__name__, type(self).__name__))
+
+    # overriding __rmul__ too keeps `3 * v` from falling back to tuple
+    # repetition. int and float skip the ABC check; other scalars such as
+    # Decimal still work, only sequences (including Vectors) are refused.
+    def __mul__(self, scalar: Any) -> 'Vector':  # type: ignore[override]
+        t = type(scalar)
+        if t is not int and t is not float and isinstance(scalar, Sequence):
+            return NotImplemented
+        x, y = self
+        return _new_tuple(Vector, (x * scalar, y * scalar))
+
+    __rmul__ = __mul__
+
+
+# below this many elements the jitted loop's dispatch overhead outweighs
+# its advantage over a plain numpy expression
+_JIT_THRESHOLD = 1000
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _jit_vector_abs(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        out = np.empty_like(xs)
+        for i in numba.prange(xs.shape[0]):
+            out[i] = sqrt(xs[i] * xs[i] + ys[i] * ys[i])
+        return out
+
+
+def vector_abs(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Return abs() of each vector given as parallel arrays of x and y"""
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    # the jitted loop does no bounds checking, so mismatched input must be
+    # rejected here rather than left for numpy broadcasting to catch
+    if xs.shape != ys.shape:
+        raise ValueError('xs and ys must have the same shape, got %r and %r'
+                         % (xs.shape, ys.shape))
+    if numba is None or xs.size < _JIT_THRESHOLD:
+        return np.sqrt(xs * xs + ys * ys)
+    # the kernel works on flat arrays; restore the input's shape afterwards
+    return _jit_vector_abs(xs.ravel(), ys.ravel()).reshape(xs.shape)
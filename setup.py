@@ -10,7 +10,8 @@ CONFIG = {
     'download_url': 'where to download it',
     'author_email': 'aguestuser@riseup.net',
     'version': '0.0.1',
-    'install_requires': ['nose'],
+    'install_requires': ['nose', 'numpy'],
+    'extras_require': {'jit': ['numba']},
     'packages': ['fluent_python'],
     'scripts': [],
     'name': 'projectname'
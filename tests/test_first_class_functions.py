@@ -4,13 +4,15 @@ Corresponds to Part III, Ch 5 (pp. 137 - 166) of the book: 'First-Class Function
 
 from typing import Callable, Iterable
 from functools import reduce
+from math import prod
 from operator import add
 from fluent_python.french_deck import FrenchDeck
 
 
 def factorial(n: int) -> int:
     '''returns n!'''
-    return 1 if n < 2 else n * factorial(n - 1)
+    # prod() of an empty range is 1, which covers n < 2
+    return prod(range(2, n + 1))
 
 
 def test_factorial():
@@ -54,6 +56,7 @@ def test_listcomp_instead_of_HOC():
 def test_alternatives_to__reduce():
     n = 4950
 
+    # sum runs the whole fold in C; prefer it over reduce(add, ...)
     assert reduce(add, range(100)) == n
     assert sum(range(100)) == n
 
@@ -119,7 +122,7 @@ def tag(name: str, *content: str, cls: str = None, **attrs: str) -> str:
 
     attr_str = (
         '',
-        ''.join(' %s="%s"' % (k, v) for k, v in sorted(attrs.items()))
+        ''.join([' %s="%s"' % (k, attrs[k]) for k in sorted(attrs)])
     )[bool(attrs)]
 
     return (
@@ -164,6 +167,14 @@ def clip(text: str, max_len: int = 80) -> str:
     return text[:end].rstrip()
 
 
+def test_clip():
+    assert clip('short text') == 'short text'
+    assert clip('banana split sundae', 10) == 'banana'
+    assert clip('bananasplit sundae', 5) == 'bananasplit'
+    assert clip('bananasplitsundae', 5) == 'bananasplitsundae'
+    assert clip('café au lait', 6) == 'café'
+
+
 def test_signature_retrieval():
     import inspect
     from inspect import signature, _ParameterKind as PK
@@ -198,6 +209,7 @@ def test_signature_binding():
 def test_arithmetic_operators():
     """p. 156"""
     from functools import reduce
+    from math import prod
     from operator import mul
 
     def ugly_fact(n: int) -> int:
@@ -207,6 +219,8 @@ def test_arithmetic_operators():
         return reduce(mul, range(1, n + 1))
 
     assert ugly_fact(42) == fact(42) == factorial(42)
+    # math.prod is the C-level builtin for a multiplicative reduce
+    assert prod(range(1, 43)) == fact(42)
 
 
 def test_selection_operators():
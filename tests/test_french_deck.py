@@ -0,0 +1,49 @@
+"""
+Corresponds to Part I, Ch 1 (pp. 3 - 8) of the book: 'The Python Data Model'
+"""
+
+import pytest
+
+from fluent_python.french_deck import Card, FrenchDeck
+
+
+def test_indexing_and_slicing():
+    deck = FrenchDeck()
+    assert len(deck) == 52
+    assert deck[0] == Card('2', 'spades')
+    assert deck[-1] == Card('A', 'hearts')
+    assert deck[:3] == [Card('2', 'spades'), Card('3', 'spades'),
+                        Card('4', 'spades')]
+    assert deck[12::13] == [Card('A', 'spades'), Card('A', 'diamonds'),
+                            Card('A', 'clubs'), Card('A', 'hearts')]
+
+
+def test_iteration():
+    deck = FrenchDeck()
+    assert list(deck) == deck[:]
+    assert Card('Q', 'hearts') in deck
+    assert Card('7', 'beasts') not in deck
+    assert [] not in deck
+
+
+def test_sorted():
+    deck = FrenchDeck()
+    cards = deck.sorted()
+    assert len(cards) == 52
+    assert cards[:4] == [Card('2', 'clubs'), Card('2', 'diamonds'),
+                         Card('2', 'hearts'), Card('2', 'spades')]
+    assert cards[-1] == Card('A', 'spades')
+    assert cards == sorted(deck, key=deck.sorting)
+
+
+def test_deck_tables_are_read_only():
+    with pytest.raises(TypeError):
+        FrenchDeck.suit_values['clubs'] = 9  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        FrenchDeck().ranks = ('A',)  # type: ignore[misc]
+
+
+def test_subclasses_cannot_override_deck_tables():
+    with pytest.raises(TypeError):
+        class ShortDeck(FrenchDeck):
+            ranks = ('7', '8', '9', '10', 'J', 'Q', 'K', 'A')
@@ -1,7 +1,22 @@
 import array
+import sys
+from itertools import product
 from typing import List
 
 symbols: str = '$¢£¥€¤'
+# UTF-32 in native byte order, so the bytes can be loaded as 'I' items
+_utf32: str = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
+
+def bulk_ord(text: str) -> array.array:
+    """ord() of every character of text, decoded in a single C call"""
+    codes = array.array('I')
+    codes.frombytes(text.encode(_utf32))
+    return codes
+
+
+# code points of symbols, decoded once and shared by the tests below
+_CODES: array.array = bulk_ord(symbols)
 
 
 def test_readability_vs_loop():
@@ -13,12 +28,15 @@ def test_readability_vs_loop():
     codes_1: List[int] = [ord(sym) for sym in symbols]
     assert codes_1 == codes
 
+    assert _CODES.tolist() == codes
+
 
 def test_readability_vs_map_filter():
     xxs = [ord(s) for s in symbols if ord(s) > 127]
     yys = list(filter(lambda c: c > 127, map(ord, symbols)))
 
     assert xxs == yys
+    assert [c for c in _CODES if c > 127] == xxs
 
 
 def test_cartesian_product():
@@ -26,11 +44,13 @@ def test_cartesian_product():
     sizes = ['S', 'M', 'L']
     tshirts = [(c, s) for c in colors for s in sizes]
     assert tshirts == [('black', 'S'), ('black', 'M'), ('black', 'L'),
-                       (['POSITIONAL_O...'max_len', 80]'white', 'S'), ('white', 'M'), ('white', 'L')]
+                       ('white', 'S'), ('white', 'M'), ('white', 'L')]
+    assert list(product(colors, sizes)) == tshirts
 
 
 def test_generator_expressions():
 
     arr = array.array('I', (ord(s) for s in symbols))
     assert arr == array.array('I', [36, 162, 163, 165, 8364, 164])
+    assert _CODES == arr
     assert True
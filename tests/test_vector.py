@@ -0,0 +1,80 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from fluent_python.vector import _JIT_THRESHOLD, Vector, vector_abs
+
+
+def test_vector_abs_matches_scalar_abs():
+    xs = np.arange(2000, dtype=np.float64)
+    ys = np.arange(2000, dtype=np.float64)[::-1].copy()
+    expected = [abs(Vector(x, y)) for x, y in zip(xs, ys)]
+
+    assert np.allclose(vector_abs(xs, ys), expected)
+    assert np.allclose(vector_abs(xs[:10], ys[:10]), expected[:10])
+
+
+def test_vector_abs_accepts_sequences():
+    assert vector_abs([3, 5], [4, 12]).tolist() == [5.0, 13.0]
+    assert vector_abs(3.0, 4.0) == 5.0
+
+
+def test_vector_abs_keeps_input_shape():
+    xs = np.full((50, 40), 3.0)
+    ys = np.full((50, 40), 4.0)
+    assert xs.size >= _JIT_THRESHOLD
+
+    result = vector_abs(xs, ys)
+    assert result.shape == (50, 40)
+    assert np.all(result == 5.0)
+    assert vector_abs(xs[:2, :2], ys[:2, :2]).tolist() == [[5.0, 5.0],
+                                                           [5.0, 5.0]]
+
+
+@pytest.mark.parametrize('n_xs, n_ys', [(10, 5), (_JIT_THRESHOLD * 2, 10)])
+def test_vector_abs_rejects_mismatched_shapes(n_xs, n_ys):
+    with pytest.raises(ValueError):
+        vector_abs(np.arange(float(n_xs)), np.arange(float(n_ys)))
+
+
+def test_vector_is_an_immutable_value():
+    v = Vector(3, 4)
+    assert v == Vector(3, 4)
+    assert {v: 'a'}[Vector(3, 4)] == 'a'
+    assert Vector() == Vector(0, 0)
+
+
+def test_vector_truthiness():
+    assert not Vector()
+    assert Vector(0, 1)
+
+
+def test_scalar_multiplication_commutes():
+    v = Vector(3, 4)
+    assert v * 3 == 3 * v == Vector(9, 12)
+    assert v * Decimal(2) == Vector(6, 8)
+
+
+def test_numpy_scalar_multiplication_returns_a_vector():
+    v = Vector(3, 4)
+    for product in (np.float64(2) * v, v * np.float64(2)):
+        assert type(product) is Vector
+        assert product == Vector(6, 8)
+
+
+def test_vector_times_vector_is_unsupported():
+    v = Vector(3, 4)
+    with pytest.raises(TypeError):
+        v * v
+    with pytest.raises(TypeError):
+        v * 'a'
+
+
+def test_vector_only_adds_to_vectors():
+    v = Vector(3, 4)
+    assert v + Vector(1, 2) == Vector(4, 6)
+    with pytest.raises(TypeError):
+        v + (1, 2)
+    with pytest.raises(TypeError):
+        (1, 2) + v